@@ -1,32 +1,48 @@
 from openpyxl import Workbook
-from typing import List
+from typing import Iterable
 from dclgen_parser.parser import Table
 
+# Shared cell constants: missing numeric fields render as _NA and the
+# nullable flag indexes _BOOL directly, no per-field ternary needed
+_NA = "N/A"
+_BOOL = ("No", "Yes")
+
 class ExcelReporter:
     """Generates Excel reports from parsed table data"""
 
-    def generate_excel_report(self, tables: List[Table], output_file: str):
-        workbook = Workbook()
-        sheet = workbook.active
-        assert sheet is not None, "Failed to create Excel sheet"
-        sheet.title = "Table Information"
+    def generate_excel_report(self, tables: Iterable[Table], output_file):
+        """
+        Write the report to output_file, a path or binary file object
+        tables may be any iterable — e.g. scan_directory_iter output — and
+        is consumed one table at a time; write-only mode spills finished
+        rows to a temporary file, so memory stays bounded for any run size
+        """
+        # Write-only mode streams rows out as they are appended instead of
+        # keeping a Cell object per value in memory until save()
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Table Information")
 
         # Add headers
-        headers = ["Table", "Name", "Type", "Length", "Precision", "Scale", "Nullable"]
-        sheet.append(headers)
+        sheet.append(("Table", "Name", "Type", "Length", "Precision", "Scale", "Nullable"))
 
+        # Bind the bound method and constants to locals so the row loop does
+        # no repeated attribute lookups
+        append = sheet.append
+        NA = _NA
+        BOOL = _BOOL
         for table in tables:
+            table_name = table.table_name
             # Add attribute data
             for attr in table.attributes:
-                sheet.append([
-                    table.table_name,
+                append((
+                    table_name,
                     attr.name,
                     attr.type,
-                    attr.length or "N/A",
-                    attr.precision or "N/A",
-                    attr.scale or "N/A",
-                    "Yes" if attr.nullable else "No"
-                ])
+                    attr.length or NA,
+                    attr.precision or NA,
+                    attr.scale or NA,
+                    BOOL[attr.nullable]
+                ))
 
         # Save the workbook
         workbook.save(output_file)
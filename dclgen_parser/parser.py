@@ -1,10 +1,45 @@
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import hashlib
 import re
-from abc import ABC, abstractmethod
+import sys
 
-@dataclass
-class Attribute:
+# Compiled once at import time so the per-declaration hot loop never pays
+# the re-module cache lookup cost
+_CHAR_RE = re.compile(r'(?:VAR)?CHAR\((\d+)\)')
+_DECIMAL_RE = re.compile(r'(?:DECIMAL|DEC)\s*\((\d+)(?:\s*,\s*(\d+))?\)', re.IGNORECASE)
+_FLOAT_PREC_RE = re.compile(r'FLOAT\((\d+)\)')
+_BLOB_RES = {dtype: re.compile(rf'{dtype}\((\d+)(?:K|M|G)?\)')
+             for dtype in ("BLOB", "CLOB", "DBCLOB")}
+_DCLGEN_TABLE_RE = re.compile(r'DCLGEN\s+TABLE\(([\w.]+)\)')
+_DECLARE_TABLE_RE = re.compile(r'DECLARE\s+([\w.]+)\s+TABLE')
+_SQL_BLOCK_RE = re.compile(r'DECLARE.*?TABLE\s*\((.*?)\)\s*END-EXEC\.',
+                           re.DOTALL | re.IGNORECASE)
+# Matches one top-level declaration, treating commas inside a single level
+# of parentheses (DECIMAL(p,s), CHAR(n), ...) as part of the declaration
+_DECL_SPLIT_RE = re.compile(r'[^,()]+(?:\([^)]*\)[^,()]*)*')
+# NOT NULL with any run of whitespace between the words; declarations are no
+# longer whitespace-normalized before the check
+_NOT_NULL_RE = re.compile(r'NOT\s+NULL')
+
+# Known type names, pre-interned so every Attribute across a scan shares one
+# string object per type instead of allocating a fresh str per column
+_TYPES = {t: sys.intern(t) for t in (
+    "CHAR", "VARCHAR", "DECIMAL", "FLOAT", "REAL", "DOUBLE",
+    "DATE", "TIME", "TIMESTAMP", "BLOB", "CLOB", "DBCLOB",
+    "INTEGER", "SMALLINT", "BIGINT")}
+
+# Single alternation that classifies a declaration in one C-level regex pass
+# instead of probing a chain of Python-level can_parse predicates
+_TYPE_DISPATCH_RE = re.compile(
+    r'\b(?P<char>(?:VAR)?CHAR)\s*\('
+    r'|\b(?P<decimal>DECIMAL|DEC)\b'
+    r'|\b(?P<float>FLOAT|REAL|DOUBLE)\b'
+    r'|\b(?P<datetime>TIMESTAMP|TIME|DATE)\b'
+    r'|\b(?P<blob>DBCLOB|CLOB|BLOB)\b',
+    re.IGNORECASE)
+
+class Attribute(NamedTuple):
     """Represents a database table attribute/column"""
     name: str
     type: str
@@ -13,192 +48,155 @@ class Attribute:
     scale: Optional[int] = None      # For DECIMAL type
     nullable: bool = True
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Table:
     """Represents a database table"""
     table_name: str
     schema_name: Optional[str]
     attributes: List[Attribute]
 
-class AttributeParser(ABC):
-    """Abstract base class for attribute parsing strategies"""
-    @abstractmethod
-    def can_parse(self, declaration: str) -> bool:
-        pass
-
-    @abstractmethod
-    def parse(self, declaration: str) -> Attribute:
-        pass
-
-class CharAttributeParser(AttributeParser):
-    """Parser for CHAR and VARCHAR type attributes"""
-    def can_parse(self, declaration: str) -> bool:
-        return "CHAR(" in declaration or "VARCHAR(" in declaration
-
-    def parse(self, declaration: str) -> Attribute:
-        parts = declaration.strip().split()
-        name = parts[0].strip()
-        type_part = " ".join(parts[1:])
-        
-        # Extract length
-        length_match = re.search(r'(?:VAR)?CHAR\((\d+)\)', type_part)
-        length = int(length_match.group(1)) if length_match else None
-        
-        # Determine if it's VARCHAR or CHAR
-        dtype = "VARCHAR" if "VARCHAR" in type_part else "CHAR"
-        
-        # Check nullable
-        nullable = "NOT NULL" not in type_part
-        
-        return Attribute(name=name, type=dtype, length=length, nullable=nullable)
-
-class DecimalAttributeParser(AttributeParser):
-    """Parser for DECIMAL type attributes"""
-    def can_parse(self, declaration: str) -> bool:
-        type_part = declaration.upper().split()[1] if len(declaration.split()) > 1 else ""
-        return type_part.startswith("DEC") or type_part.startswith("DECIMAL")
-
-    def parse(self, declaration: str) -> Attribute:
-        parts = declaration.strip().split()
-        name = parts[0].strip()
-        type_part = " ".join(parts[1:]).upper()
-
-        # Extract precision and scale
-        # Handle both DECIMAL(p,s) and DEC(p,s) formats
-        decimal_match = re.search(r'(?:DECIMAL|DEC)\s*\((\d+)(?:\s*,\s*(\d+))?\)', type_part, re.IGNORECASE)
-        if not decimal_match:
-            raise ValueError(f"Invalid DECIMAL format in declaration: {declaration}")
-            
-        precision = int(decimal_match.group(1))
-        scale = int(decimal_match.group(2)) if decimal_match.group(2) else 0
-
-        nullable = "NOT NULL" not in type_part
-        
-        return Attribute(
-            name=name,
-            type="DECIMAL",
-            precision=precision,
-            scale=scale,
-            nullable=nullable
-        )
+def _split_declaration(declaration: str) -> Tuple[str, str]:
+    """Split a declaration into the column name and the remaining type text"""
+    parts = declaration.split(None, 1)
+    return parts[0], parts[1] if len(parts) > 1 else ''
 
-class FloatAttributeParser(AttributeParser):
-    """Parser for FLOAT type attributes"""
-    def can_parse(self, declaration: str) -> bool:
-        return any(type_name in declaration.upper() for type_name in ["FLOAT", "REAL", "DOUBLE"])
-
-    def parse(self, declaration: str) -> Attribute:
-        parts = declaration.strip().split()
-        name = parts[0].strip()
-        type_part = " ".join(parts[1:]).upper()
-        
-        # Determine specific float type
-        if "REAL" in type_part:
-            dtype = "REAL"
-        elif "DOUBLE" in type_part:
-            dtype = "DOUBLE"
-        else:
-            dtype = "FLOAT"
-            
-        # Check for precision in FLOAT
-        precision = None
-        if dtype == "FLOAT":
-            precision_match = re.search(r'FLOAT\((\d+)\)', type_part)
-            if precision_match:
-                precision = int(precision_match.group(1))
-        
-        nullable = "NOT NULL" not in type_part
-        
-        return Attribute(name=name, type=dtype, precision=precision, nullable=nullable)
-
-class DateTimeAttributeParser(AttributeParser):
-    """Parser for DATE, TIME, and TIMESTAMP type attributes"""
-    def can_parse(self, declaration: str) -> bool:
-        return any(type_name in declaration.upper() for type_name in ["DATE", "TIME", "TIMESTAMP"])
-
-    def parse(self, declaration: str) -> Attribute:
-        parts = declaration.strip().split()
-        name = parts[0].strip()
-        type_part = " ".join(parts[1:]).upper()
-        
-        # Determine specific type
-        if "TIMESTAMP" in type_part:
-            dtype = "TIMESTAMP"
-        elif "TIME" in type_part:
-            dtype = "TIME"
-        else:
-            dtype = "DATE"
-            
-        nullable = "NOT NULL" not in type_part
-        
-        return Attribute(name=name, type=dtype, nullable=nullable)
-
-class BlobAttributeParser(AttributeParser):
-    """Parser for BLOB, CLOB, and DBCLOB type attributes"""
-    def can_parse(self, declaration: str) -> bool:
-        return any(type_name in declaration.upper() for type_name in ["BLOB", "CLOB", "DBCLOB"])
-
-    def parse(self, declaration: str) -> Attribute:
-        parts = declaration.strip().split()
-        name = parts[0].strip()
-        type_part = " ".join(parts[1:]).upper()
-        
-        # Determine specific type
-        if "DBCLOB" in type_part:
-            dtype = "DBCLOB"
-        elif "CLOB" in type_part:
-            dtype = "CLOB"
-        else:
-            dtype = "BLOB"
-            
-        # Extract length if specified
-        length_match = re.search(rf'{dtype}\((\d+)(?:K|M|G)?\)', type_part)
-        length = int(length_match.group(1)) if length_match else None
-        
-        nullable = "NOT NULL" not in type_part
-        
-        return Attribute(name=name, type=dtype, length=length, nullable=nullable)
-
-class SimpleAttributeParser(AttributeParser):
-    """Parser for simple types (INTEGER, SMALLINT, BIGINT)"""
-    def can_parse(self, declaration: str) -> bool:
-        return True  # Fallback parser for all other types
-
-    def parse(self, declaration: str) -> Attribute:
-        parts = declaration.strip().split()
-        name = parts[0].strip()
-        dtype = parts[1].strip().upper()
-        nullable = "NOT NULL" not in declaration
-        
-        return Attribute(name=name, type=dtype, nullable=nullable)
+def _parse_char(declaration: str) -> Attribute:
+    """Parse a CHAR or VARCHAR attribute declaration"""
+    name, type_part = _split_declaration(declaration)
+
+    # Extract length
+    length_match = _CHAR_RE.search(type_part)
+    length = int(length_match.group(1)) if length_match else None
+
+    # Determine if it's VARCHAR or CHAR
+    dtype = "VARCHAR" if "VARCHAR" in type_part else "CHAR"
+
+    # Check nullable
+    nullable = _NOT_NULL_RE.search(type_part) is None
+
+    return Attribute(name=name, type=dtype, length=length, nullable=nullable)
+
+def _parse_decimal(declaration: str) -> Attribute:
+    """Parse a DECIMAL/DEC attribute declaration"""
+    name, type_part = _split_declaration(declaration)
+    type_part = type_part.upper()
+
+    # Extract precision and scale
+    # Handle both DECIMAL(p,s) and DEC(p,s) formats
+    decimal_match = _DECIMAL_RE.search(type_part)
+    if not decimal_match:
+        raise ValueError(f"Invalid DECIMAL format in declaration: {declaration}")
+
+    precision = int(decimal_match.group(1))
+    scale = int(decimal_match.group(2)) if decimal_match.group(2) else 0
+
+    nullable = _NOT_NULL_RE.search(type_part) is None
+
+    return Attribute(
+        name=name,
+        type="DECIMAL",
+        precision=precision,
+        scale=scale,
+        nullable=nullable
+    )
+
+def _parse_float(declaration: str) -> Attribute:
+    """Parse a FLOAT, REAL or DOUBLE attribute declaration"""
+    name, type_part = _split_declaration(declaration)
+    type_part = type_part.upper()
+
+    # Determine specific float type
+    if "REAL" in type_part:
+        dtype = "REAL"
+    elif "DOUBLE" in type_part:
+        dtype = "DOUBLE"
+    else:
+        dtype = "FLOAT"
+
+    # Check for precision in FLOAT
+    precision = None
+    if dtype == "FLOAT":
+        precision_match = _FLOAT_PREC_RE.search(type_part)
+        if precision_match:
+            precision = int(precision_match.group(1))
+
+    nullable = _NOT_NULL_RE.search(type_part) is None
+
+    return Attribute(name=name, type=dtype, precision=precision, nullable=nullable)
+
+def _parse_datetime(declaration: str) -> Attribute:
+    """Parse a DATE, TIME or TIMESTAMP attribute declaration"""
+    name, type_part = _split_declaration(declaration)
+    type_part = type_part.upper()
+
+    # Determine specific type
+    if "TIMESTAMP" in type_part:
+        dtype = "TIMESTAMP"
+    elif "TIME" in type_part:
+        dtype = "TIME"
+    else:
+        dtype = "DATE"
+
+    nullable = _NOT_NULL_RE.search(type_part) is None
+
+    return Attribute(name=name, type=dtype, nullable=nullable)
+
+def _parse_blob(declaration: str) -> Attribute:
+    """Parse a BLOB, CLOB or DBCLOB attribute declaration"""
+    name, type_part = _split_declaration(declaration)
+    type_part = type_part.upper()
+
+    # Determine specific type
+    if "DBCLOB" in type_part:
+        dtype = "DBCLOB"
+    elif "CLOB" in type_part:
+        dtype = "CLOB"
+    else:
+        dtype = "BLOB"
+
+    # Extract length if specified
+    length_match = _BLOB_RES[dtype].search(type_part)
+    length = int(length_match.group(1)) if length_match else None
+
+    nullable = _NOT_NULL_RE.search(type_part) is None
+
+    return Attribute(name=name, type=dtype, length=length, nullable=nullable)
+
+def _parse_simple(declaration: str) -> Attribute:
+    """Fallback parser for simple types (INTEGER, SMALLINT, BIGINT, ...)"""
+    name, type_part = _split_declaration(declaration)
+    dtype = type_part.split(None, 1)[0].upper()
+    nullable = _NOT_NULL_RE.search(type_part.upper()) is None
+
+    return Attribute(name=name, type=_TYPES.get(dtype) or sys.intern(dtype), nullable=nullable)
+
+# Maps the dispatch regex group name to the matching parse function
+_PARSE_DISPATCH: Dict[str, Callable[[str], Attribute]] = {
+    "char": _parse_char,
+    "decimal": _parse_decimal,
+    "float": _parse_float,
+    "datetime": _parse_datetime,
+    "blob": _parse_blob,
+}
 
 class DCLGENParser:
     """Main parser class for DCLGEN files"""
-    def __init__(self):
-        self.parsers: List[AttributeParser] = [
-            CharAttributeParser(),
-            DecimalAttributeParser(),
-            FloatAttributeParser(),
-            DateTimeAttributeParser(),
-            BlobAttributeParser(),
-            SimpleAttributeParser()  # Fallback parser
-        ]
 
     def _extract_schema_and_table_names(self, content: str) -> Tuple[str, Optional[str]]:
         """Extract schema and table name from DCLGEN content"""
         # First try to get schema from DCLGEN TABLE declaration
         dclgen_schema = None
-        dclgen_match = re.search(r'DCLGEN\s+TABLE\(([\w.]+)\)', content)
+        dclgen_match = _DCLGEN_TABLE_RE.search(content)
         if dclgen_match:
             dclgen_parts = dclgen_match.group(1).split('.')
             if len(dclgen_parts) == 2:
                 dclgen_schema = dclgen_parts[0]
 
         # Extract table name from DECLARE statement - handling schema-qualified names
-        table_match = re.search(r'DECLARE\s+([\w.]+)\s+TABLE', content)
+        table_match = _DECLARE_TABLE_RE.search(content)
         if not table_match:
             raise ValueError("Could not find table declaration in DCLGEN")
-            
+
         full_table_name = table_match.group(1)
         # Split schema and table name
         parts = full_table_name.split('.')
@@ -207,86 +205,108 @@ class DCLGENParser:
         else:
             schema_name = dclgen_schema  # Use schema from DCLGEN TABLE if available
             table_name = full_table_name
-            
-        return table_name, schema_name
+
+        # Schemas recur across a whole scan; interning dedupes them
+        return table_name, sys.intern(schema_name) if schema_name else schema_name
+
+    def _parse_declaration(self, declaration: str) -> Attribute:
+        """Parse a single attribute declaration, dispatching on its type keyword"""
+        # Classify only the part after the attribute name so a column named
+        # e.g. DATE does not confuse the dispatch. Tokenize exactly like
+        # _split_declaration: a continuation can leave a newline rather
+        # than a space between name and type
+        _, type_part = _split_declaration(declaration)
+        match = _TYPE_DISPATCH_RE.search(type_part)
+        if match:
+            return _PARSE_DISPATCH[match.lastgroup](declaration)
+        return _parse_simple(declaration)
 
     def _extract_attributes(self, content: str) -> List[Attribute]:
         """Extract attributes from DCLGEN content"""
         # Find the SQL declaration block
-        sql_block_match = re.search(r'DECLARE.*?TABLE\s*\((.*?)\)\s*END-EXEC\.', 
-                                  content, re.DOTALL | re.IGNORECASE)
+        sql_block_match = _SQL_BLOCK_RE.search(content)
         if not sql_block_match:
             raise ValueError("Could not find SQL declaration block")
 
-        attributes = []
+        attributes: List[Attribute] = []
         # Get the full declaration block
         sql_block = sql_block_match.group(1).strip()
-        
-        # Split declarations while preserving commas inside parentheses
-        declarations = []
-        current_decl = []
-        paren_count = 0
-        
-        # Split into lines first to handle potential formatting
-        for char in sql_block:
-            if char == '(':
-                paren_count += 1
-            elif char == ')':
-                paren_count -= 1
-            
-            if char == ',' and paren_count == 0:
-                # End of declaration
-                if current_decl:
-                    declarations.append(''.join(current_decl).strip())
-                current_decl = []
-            else:
-                current_decl.append(char)
-        
-        # Add the last declaration if exists
-        if current_decl:
-            declarations.append(''.join(current_decl).strip())
-        
-        # Process each declaration
-        for decl in declarations:
-            if not decl.strip():
+
+        # Split into declarations on top-level commas; the regex keeps commas
+        # inside parentheses with their declaration, so the whole split runs
+        # in the C regex engine instead of a per-character Python loop.
+        # Method/global lookups are bound to locals outside the loop
+        append = attributes.append
+        parse_declaration = self._parse_declaration
+        for match in _DECL_SPLIT_RE.finditer(sql_block):
+            decl = match.group(0).strip()
+            if not decl:
                 continue
-                
-            # Find appropriate parser
-            parser = next(p for p in self.parsers if p.can_parse(decl))
-            attribute = parser.parse(decl)
-            attributes.append(attribute)
+
+            append(parse_declaration(decl))
 
         return attributes
 
+    def _strip_fixed_format(self, content: str) -> str:
+        """Strip the fixed-format areas from content"""
+        # Single generator feeding str.join: drop comment lines (asterisk in
+        # column 7), strip the sequence-number (1-6) and identification
+        # (73-80) areas, and preserve blank or short lines as-is
+        return '\n'.join(
+            line if len(line) < 7 or not line.strip() else line[6:72]
+            for line in content.splitlines()
+            if len(line) < 7 or line[6] != '*'
+        )
+
     def _clean_cobol_format(self, content: str) -> str:
         """Clean COBOL fixed-format content by removing sequence numbers, line identifiers and comments"""
-        cleaned_lines = []
-        for line in content.splitlines():
-            # Skip empty lines
-            if not line.strip():
-                cleaned_lines.append(line)
-                continue
-            
-            # If line is shorter than 7 characters, preserve it as is
-            if len(line) < 7:
-                cleaned_lines.append(line)
-                continue
-            
-            # Check if it's a comment line (asterisk in column 7)
-            if len(line) > 6 and line[6] == '*':
-                continue
-                
-            # Remove sequence numbers (1-6) and keep only the content starting from column 7
-            # For longer lines, also remove the identification area (73-80)
-            content_line = line[6:72] if len(line) > 72 else line[6:]
-            cleaned_lines.append(content_line)
-            
-        return '\n'.join(cleaned_lines)
+        # Free-format content starts its text before the sequence-number
+        # area and has nothing to strip; detect that from the first
+        # non-blank line and skip rebuilding the whole string. A contiguous
+        # alphanumeric token filling columns 1-6 is a sequence tag (numeric
+        # or CRnnnn-style), so only lines whose first six columns contain
+        # whitespace or punctuation count as free format; anything ambiguous
+        # (leading blanks, a column-7 asterisk, or an identification area
+        # past column 72) takes the stripping path
+        first = next((line for line in content.splitlines() if line.strip()), '')
+        if first and not first.startswith(' ') and len(first) < 73 \
+                and not first[:6].isalnum() and (len(first) < 7 or first[6] != '*'):
+            return content
+        return self._strip_fixed_format(content)
+
+    # Content-hash cache of parsed tables, shared across instances; large
+    # scans often contain byte-identical copies of the same DCLGEN. Keyed on
+    # a digest so the cache never retains the file contents themselves
+    _parse_cache: Dict[bytes, Table] = {}
+    _PARSE_CACHE_MAX = 1024
 
     def parse(self, content: str) -> Table:
         """Parse DCLGEN content and return Table object"""
+        key = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        table = self._parse_cache.get(key)
+        if table is not None:
+            return table
+
         # Clean up COBOL fixed-format content first
         cleaned_content = self._clean_cobol_format(content)
-        table_name, schema_name = self._extract_schema_and_table_names(cleaned_content)
-        attributes = self._extract_attributes(cleaned_content)
-        return Table(table_name=table_name, schema_name=schema_name, attributes=attributes)
+        try:
+            table_name, schema_name = self._extract_schema_and_table_names(cleaned_content)
+            attributes = self._extract_attributes(cleaned_content)
+        except ValueError:
+            # The format heuristic guessed wrong for this file: retry with
+            # the opposite treatment before giving up, so a surprising
+            # first line never makes a parseable file fail
+            retried = (self._strip_fixed_format(content)
+                       if cleaned_content is content else content)
+            table_name, schema_name = self._extract_schema_and_table_names(retried)
+            attributes = self._extract_attributes(retried)
+        table = Table(table_name=table_name, schema_name=schema_name, attributes=attributes)
+
+        if len(self._parse_cache) >= self._PARSE_CACHE_MAX:
+            self._parse_cache.clear()
+        self._parse_cache[key] = table
+        return table
+
+# Shared stateless instance; the parser holds no per-instance state, so one
+# module-level singleton serves every scanner and CLI entry point
+DEFAULT_PARSER = DCLGENParser()
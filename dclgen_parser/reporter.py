@@ -1,31 +1,72 @@
-from typing import Dict, List
+from itertools import chain
+from typing import Dict, Iterable, Iterator, Tuple
 import csv
+import re
 
 from dclgen_parser.parser import Table
 
+_HEADER = ('Table Name', 'Number of Attributes', 'File Path', 'Schema', 'Normalized File Name')
+
+# A field containing any of these needs the csv module's quoting rules
+_UNSAFE_FIELD_RE = re.compile(r'[",\r\n]')
+
+def _report_rows(tables_stats: Dict[str, Table]) -> Iterator[Tuple]:
+    """Yield one report row per table, sorted by table name"""
+    # Sorting the items pairs each name with its table up front, so the
+    # loop does no per-key dict lookup
+    for table_name, table in sorted(tables_stats.items()):
+        yield (
+            table_name,
+            len(table.attributes),
+            "N/A",  # File path is not available in this context
+            table.schema_name or "N/A",
+            table.table_name.upper()
+        )
+
+def _write_rows(csvfile, rows: Iterable[Tuple]) -> None:
+    """
+    Write rows as CSV. Table names, counts and schemas almost never need
+    quoting, so safe rows are serialized with a plain join and written in
+    batches; any row with a delimiter, quote or newline in a field falls
+    back to csv.writer, which applies the full quoting rules
+    """
+    writer = None
+    batch = []
+    for row in rows:
+        fields = [str(value) for value in row]
+        if any(_UNSAFE_FIELD_RE.search(field) for field in fields):
+            if batch:
+                csvfile.write(''.join(batch))
+                batch.clear()
+            if writer is None:
+                writer = csv.writer(csvfile)
+            writer.writerow(row)
+        else:
+            batch.append(','.join(fields) + '\r\n')
+            if len(batch) >= 1000:
+                csvfile.write(''.join(batch))
+                batch.clear()
+    if batch:
+        csvfile.write(''.join(batch))
+
 class ReportGenerator:
     """Generates CSV reports from DCLGEN scanning results"""
-    
-    def generate_report(self, tables_stats: Dict[str, Table], output_file: str):
-        """Generate a CSV report of the DCLGEN scanning results"""
+
+    def generate_report(self, tables_stats: Dict[str, Table], output_file):
+        """
+        Generate a CSV report of the DCLGEN scanning results
+        output_file is a path or any writable text file object; writing to
+        e.g. io.StringIO keeps the report entirely in memory
+        """
+        rows = chain((_HEADER,), _report_rows(tables_stats))
+        if hasattr(output_file, 'write'):
+            _write_rows(output_file, rows)
+            return
+
         # Ensure output file has .csv extension
         if not output_file.lower().endswith('.csv'):
             output_file = output_file + '.csv'
-            
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Write header
-            writer.writerow([ 'Table Name', 'Number of Attributes', 'File Path', 'Schema', 'Normalized File Name'])
-            
-            # Write data rows
-            for table_name in sorted(tables_stats.keys()):
-                table = tables_stats[table_name]
-                normalized_filename = table.table_name.upper()
-                writer.writerow([
-                    table_name,
-                    len(table.attributes),
-                    "N/A",  # File path is not available in this context
-                    table.schema_name or "N/A",
-                    normalized_filename
-                ])
+
+        # Large buffer keeps write syscalls rare on big reports
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            _write_rows(csvfile, rows)
@@ -1,52 +1,254 @@
+import os
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict
-from dclgen_parser.parser import DCLGENParser, Table  # Import the parser we created earlier
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+from dclgen_parser.parser import DCLGENParser, DEFAULT_PARSER, Table  # Import the parser we created earlier
+
+
+# How much of a file head to read when sniffing for the DCLGEN markers
+_SNIFF_SIZE = 16384
+
+# Both DCLGEN markers in one alternation so detection is a single linear
+# pass over the head instead of one full scan per marker
+_SNIFF_RE = re.compile(rb'DCLGEN TABLE|EXEC SQL DECLARE')
+
+
+def _has_dclgen_markers(head: bytes) -> bool:
+    """True when the head contains both DCLGEN markers; found in one pass,
+    bailing out as soon as the second distinct marker shows up"""
+    seen = set()
+    for match in _SNIFF_RE.finditer(head):
+        seen.add(match.group())
+        if len(seen) == 2:
+            return True
+    return False
+
+
+def _iter_files(root: str) -> Iterator[str]:
+    """
+    Yield every regular file under root as a path string
+    os.scandir reuses the directory entry's cached file type, avoiding the
+    extra stat call and Path allocation rglob pays per entry
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+
+def _parse_file(path_str: str, parser: DCLGENParser = DEFAULT_PARSER) -> Optional[Table]:
+    """
+    Worker for parallel scans: read and parse one candidate file
+    Must live at module level so process pool workers can import it
+    """
+    try:
+        with open(path_str, 'rb') as f:
+            head = f.read(_SNIFF_SIZE)
+            if not _has_dclgen_markers(head):
+                return None
+            content = head + f.read()
+    except IOError:
+        return None
+    return parser.parse(content.decode('latin-1'))
+
+
+# Extensions DCLGEN copybooks ship under in practice; anything else is
+# skipped without being opened
+_DEFAULT_EXTENSIONS = frozenset({'.dclgen', '.dcl', '.cpy', '.cbl'})
+
+_DEFAULT_CACHE_FILE = os.path.join(
+    os.path.expanduser('~'), '.cache', 'dclgen_parser', 'scan.pkl')
+
+
+class ScanCache:
+    """
+    Persistent cache of parsed tables keyed on (mtime, size) per path, so
+    re-scanning an unchanged tree costs one stat per file instead of a
+    read and parse. Opt-in: pass an instance to DCLGENScanner to use it
+    """
+
+    def __init__(self, cache_file: str = _DEFAULT_CACHE_FILE):
+        self.cache_file = cache_file
+        try:
+            with open(cache_file, 'rb') as f:
+                self._entries = pickle.load(f)
+        except (IOError, EOFError, pickle.PickleError):
+            self._entries = {}
+        self._dirty = False
+
+    def get(self, path: str) -> Optional[Table]:
+        """Return the cached table for path if its mtime and size still match"""
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        return None
+
+    def put(self, path: str, table: Table) -> None:
+        """Record the parsed table for path under its current mtime and size"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        self._entries[path] = (st.st_mtime_ns, st.st_size, table)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache to disk if anything changed; failures are ignored"""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump(self._entries, f, pickle.HIGHEST_PROTOCOL)
+        except IOError:
+            return
+        self._dirty = False
 
 
 class DCLGENScanner:
     """Scans directories for DCLGEN files and processes them"""
-    
-    def __init__(self):
-        self.parser = DCLGENParser()
-        
+
+    def __init__(self, parser: Optional[DCLGENParser] = None,
+                 cache: Optional[ScanCache] = None,
+                 extensions: Optional[Iterable[str]] = None):
+        self.parser = parser or DEFAULT_PARSER
+        self.cache = cache
+        # Only files with these extensions are sniffed; None keeps the default
+        self.extensions = (frozenset(ext.lower() for ext in extensions)
+                           if extensions is not None else _DEFAULT_EXTENSIONS)
+
+    def _candidate_files(self, directory_path: str) -> Iterator[str]:
+        """Walk the tree, keeping only paths whose extension can be a DCLGEN
+        so everything else is skipped without ever being opened"""
+        extensions = self.extensions
+        splitext = os.path.splitext
+        for file_path in _iter_files(directory_path):
+            if splitext(file_path)[1].lower() in extensions:
+                yield file_path
+
     def is_dclgen_file(self, file_path: Path) -> bool:
         """
         Check if a file is likely a DCLGEN file by looking for typical DCLGEN content
+        Only the head of the file is read: the DCLGEN header always appears
+        near the top, so unrelated large files are rejected after one read
         """
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                return 'DCLGEN TABLE' in content and 'EXEC SQL DECLARE' in content
-        except (UnicodeDecodeError, IOError):
+            with open(file_path, 'rb') as f:
+                head = f.read(_SNIFF_SIZE)
+        except IOError:
             return False
-            
+        return _has_dclgen_markers(head)
+
+    def _read_dclgen(self, file_path: Union[str, Path]) -> Optional[str]:
+        """
+        Read a candidate file, returning its content only if it looks like
+        a DCLGEN file. Only the head is read for the marker check — the
+        DCLGEN header sits near the top — so a large unrelated file costs
+        one bounded read to reject; the remainder is read only on a match.
+        Files are read as bytes so rejected files never pay a decode;
+        accepted content is decoded once with latin-1, a byte-to-codepoint
+        mapping that cannot raise on mainframe output
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(_SNIFF_SIZE)
+                if not _has_dclgen_markers(head):
+                    return None
+                content = head + f.read()
+        except IOError:
+            return None
+        return content.decode('latin-1')
+
+    def scan_directory_iter(self, directory_path: str) -> Iterator[Tuple[str, Table]]:
+        """
+        Scan a directory for DCLGEN files, yielding (table_name, table)
+        pairs as each file is parsed. Lets a reporter write rows while the
+        walk is still running and keeps peak memory at one table instead
+        of the whole result set
+        """
+        seen = set()
+        cache = self.cache
+        # Walk through all files in the directory and subdirectories
+        for file_path in self._candidate_files(directory_path):
+            table = cache.get(file_path) if cache else None
+            if table is None:
+                content = self._read_dclgen(file_path)
+                if content is None:
+                    continue
+
+                table = self.parser.parse(content)
+                if cache:
+                    cache.put(file_path, table)
+            # Single hash of the name: the set grows exactly when it was new
+            before = len(seen)
+            seen.add(table.table_name)
+            if len(seen) == before:
+                raise ValueError(f"Table '{table.table_name}' is defined more than once")
+            yield table.table_name, table
+        if cache:
+            cache.save()
+
     def scan_directory(self, directory_path: str) -> Dict[str, Table]:
         """
         Scan a directory for DCLGEN files and process them
         Returns a dictionary mapping table names to their statistics
         """
         tables_stats: Dict[str, Table] = {}
-        
-        # Convert to Path object for easier manipulation
-        base_path = Path(directory_path)
-        
-        # Walk through all files in the directory and subdirectories
-        for file_path in base_path.rglob('*'):
-            if not file_path.is_file():
-                continue
-                
-            if not self.is_dclgen_file(file_path):
-                continue
-                
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    table = self.parser.parse(content)
-                    if table.table_name in tables_stats:
-                        raise ValueError(f"Table '{table.table_name}' is defined more than once")
-                    tables_stats[table.table_name] = table
-            except Exception as e:
-                raise e
-                    
+
+        for table_name, table in self.scan_directory_iter(directory_path):
+            tables_stats[table_name] = table
+
         return tables_stats
-    
+
+    def scan_directory_parallel(self, directory_path: str, workers: Optional[int] = None) -> Dict[str, Table]:
+        """
+        Scan a directory for DCLGEN files, parsing them across a process pool
+        Parsing is pure-Python CPU work with no shared state, so it fans out
+        across cores; the duplicate-table check and the scan cache stay in
+        the parent process — cache hits never reach the pool
+        """
+        tables_stats: Dict[str, Table] = {}
+
+        def record(table: Table) -> None:
+            # Single hash of the name: the dict grows exactly when it was new
+            before = len(tables_stats)
+            tables_stats[table.table_name] = table
+            if len(tables_stats) == before:
+                raise ValueError(f"Table '{table.table_name}' is defined more than once")
+
+        cache = self.cache
+        pending = []
+        for file_path in self._candidate_files(directory_path):
+            table = cache.get(file_path) if cache else None
+            if table is not None:
+                record(table)
+            else:
+                pending.append(file_path)
+
+        # Large chunks amortize the pickling cost of sending paths to workers
+        chunksize = max(1, len(pending) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parse_file = partial(_parse_file, parser=self.parser)
+            for file_path, table in zip(pending, executor.map(parse_file, pending, chunksize=chunksize)):
+                if table is None:
+                    continue
+                if cache:
+                    cache.put(file_path, table)
+                record(table)
+        if cache:
+            cache.save()
+        return tables_stats
+
@@ -0,0 +1,63 @@
+from typing import Iterable
+from xml.sax.saxutils import escape
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from dclgen_parser.parser import Table
+
+# Fixed boilerplate parts of a minimal XLSX package; only the worksheet
+# itself is generated row by row
+_CONTENT_TYPES = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"><Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/><Default Extension="xml" ContentType="application/xml"/><Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/><Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/></Types>"""
+
+_ROOT_RELS = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/></Relationships>"""
+
+_WORKBOOK = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets><sheet name="Table Information" sheetId="1" r:id="rId1"/></sheets></workbook>"""
+
+_WORKBOOK_RELS = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/></Relationships>"""
+
+_SHEET_HEADER = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>"""
+
+_SHEET_FOOTER = b"</sheetData></worksheet>"
+
+def _cell(value) -> str:
+    """Serialize one cell, using a plain number cell for ints"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return f'<c><v>{value}</v></c>'
+    return f'<c t="inlineStr"><is><t>{escape(str(value))}</t></is></c>'
+
+class StreamingXlsxReporter:
+    """Generates Excel reports by streaming worksheet XML straight into the
+    XLSX ZIP container, without per-cell workbook objects"""
+
+    def generate_excel_report(self, tables: Iterable[Table], output_file: str):
+        with ZipFile(output_file, 'w', ZIP_DEFLATED) as archive:
+            archive.writestr('[Content_Types].xml', _CONTENT_TYPES)
+            archive.writestr('_rels/.rels', _ROOT_RELS)
+            archive.writestr('xl/workbook.xml', _WORKBOOK)
+            archive.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS)
+
+            with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+                sheet.write(_SHEET_HEADER)
+                sheet.write(self._row(
+                    ("Table", "Name", "Type", "Length", "Precision", "Scale", "Nullable")))
+                for table in tables:
+                    table_name = table.table_name
+                    for attr in table.attributes:
+                        sheet.write(self._row((
+                            table_name,
+                            attr.name,
+                            attr.type,
+                            attr.length or "N/A",
+                            attr.precision or "N/A",
+                            attr.scale or "N/A",
+                            "Yes" if attr.nullable else "No"
+                        )))
+                sheet.write(_SHEET_FOOTER)
+
+    def _row(self, values) -> bytes:
+        """Serialize one worksheet row"""
+        return ('<row>' + ''.join(_cell(v) for v in values) + '</row>').encode('utf-8')
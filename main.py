@@ -4,7 +4,7 @@ from datetime import datetime
 
 from dclgen_parser.excel_reporter import ExcelReporter
 
-from dclgen_parser.scanner import DCLGENScanner
+from dclgen_parser.scanner import DCLGENScanner, ScanCache
 from dclgen_parser.parser import Table
 
 def main():
@@ -14,6 +14,13 @@ def main():
     parser.add_argument('--output', '-o', 
                        default='dclgen_report.csv',
                        help='Output file for the CSV report (default: dclgen_report.csv)')
+    parser.add_argument('--jobs', '-j',
+                       type=int,
+                       default=None,
+                       help='Parse files in parallel using this many worker processes')
+    parser.add_argument('--cache',
+                       action='store_true',
+                       help='Reuse results for unchanged files from a persistent cache')
     
     args = parser.parse_args()
     
@@ -24,16 +31,19 @@ def main():
         return 1
         
     # Create scanner and process files
-    scanner = DCLGENScanner()
-    tables = scanner.scan_directory(args.directory)
-    
-    # Generate table stats
-    tables_stats = list(tables.values())
+    cache = None
+    if args.cache and not os.environ.get('DCLGEN_NO_CACHE'):
+        cache = ScanCache()
+    scanner = DCLGENScanner(cache=cache)
+    if args.jobs:
+        tables = scanner.scan_directory_parallel(args.directory, workers=args.jobs)
+    else:
+        tables = scanner.scan_directory(args.directory)
     
     # Generate Excel report
     excel_reporter = ExcelReporter()
     excel_file_name = f"report_{datetime.now().strftime('%Y-%m-%d')}.xlsx"
-    excel_reporter.generate_excel_report(tables_stats, excel_file_name)
+    excel_reporter.generate_excel_report(tables.values(), excel_file_name)
     
     print(f"Excel report generated: {excel_file_name}")
     return 0
@@ -1,42 +1,34 @@
 import sys
 import argparse
 import os
-from prettytable import PrettyTable
-from dclgen_parser.parser import DCLGENParser
+from dclgen_parser.parser import DEFAULT_PARSER
 from dclgen_parser.excel_reporter import ExcelReporter
 
 def print_table_info(table):
     """Print general table information"""
-    print("\nTable Information:")
-    info_table = PrettyTable()
-    info_table.field_names = ["Property", "Value"]
-    info_table.align["Property"] = "l"
-    info_table.align["Value"] = "l"
-    
-    info_table.add_row(["Table Name", table.table_name])
-    info_table.add_row(["Schema Name", table.schema_name or "N/A"])
-    info_table.add_row(["Total Attributes", len(table.attributes)])
-    
-    print(info_table)
+    buf = ["\nTable Information:\n"]
+    buf.append(f"{'Table Name':<20}{table.table_name}\n")
+    buf.append(f"{'Schema Name':<20}{table.schema_name or 'N/A'}\n")
+    buf.append(f"{'Total Attributes':<20}{len(table.attributes)}\n")
+    sys.stdout.write(''.join(buf))
 
 def print_attributes(attributes):
     """Print detailed attribute information"""
-    print("\nAttributes:")
-    attr_table = PrettyTable()
-    attr_table.field_names = ["Name", "Type", "Length", "Precision", "Scale", "Nullable"]
-    attr_table.align = "l"  # Left align all columns
-    
+    # One pass to size the name column, then straight f-string formatting;
+    # the remaining columns have known maximum widths
+    name_width = max((len(attr.name) for attr in attributes), default=4) + 2
+    buf = ["\nAttributes:\n"]
+    buf.append(f"{'Name':<{name_width}}{'Type':<12}{'Length':<10}{'Precision':<12}{'Scale':<8}Nullable\n")
     for attr in attributes:
-        attr_table.add_row([
-            attr.name,
-            attr.type,
-            attr.length or "N/A",
-            attr.precision or "N/A",
-            attr.scale or "N/A",
-            "Yes" if attr.nullable else "No"
-        ])
-    
-    print(attr_table)
+        buf.append(
+            f"{attr.name:<{name_width}}"
+            f"{attr.type:<12}"
+            f"{str(attr.length or 'N/A'):<10}"
+            f"{str(attr.precision or 'N/A'):<12}"
+            f"{str(attr.scale or 'N/A'):<8}"
+            f"{'Yes' if attr.nullable else 'No'}\n"
+        )
+    sys.stdout.write(''.join(buf))
 
 def main():
     parser = argparse.ArgumentParser(description='Parse a single DCLGEN file and display its contents')
@@ -58,8 +50,7 @@ def main():
             print("=" * 80)
         
         # Parse the file
-        dclgen_parser = DCLGENParser()
-        table = dclgen_parser.parse(content)
+        table = DEFAULT_PARSER.parse(content)
         
         # Print results
         print("\nDCLGEN File Analysis Report")
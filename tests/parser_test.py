@@ -200,6 +200,51 @@ CR0146       D_BSN_DT_INI                   DATE NOT NULL
         self.assertEqual(ts_attr.type, "TIMESTAMP")
         self.assertFalse(ts_attr.nullable)
 
+    def test_newline_separated_declaration(self):
+        """Test a continuation that leaves only a newline between name and type"""
+        dclgen = """
+           EXEC SQL DECLARE TEST_TABLE TABLE                                 
+           ( COL_A
+CR0146CHAR(10) NOT NULL,
+             COL_B                         INTEGER NOT NULL
+           ) END-EXEC.
+        """
+        table = self.parser.parse(dclgen)
+
+        col_a = next(attr for attr in table.attributes if attr.name == "COL_A")
+        self.assertEqual(col_a.type, "CHAR")
+        self.assertEqual(col_a.length, 10)
+        self.assertFalse(col_a.nullable)
+
+    def test_sequence_tag_on_first_line(self):
+        """Test fixed-format content whose first line carries an alphanumeric sequence tag"""
+        dclgen = (
+            "CR0145     EXEC SQL DECLARE TEST_TABLE TABLE\n"
+            "CR0146     ( FIRST_COL                     CHAR(16) NOT NULL,\n"
+            "CR0147       SECOND_COL                    INTEGER NOT NULL\n"
+            "CR0148     ) END-EXEC.\n"
+        )
+        table = self.parser.parse(dclgen)
+
+        self.assertEqual(table.table_name, "TEST_TABLE")
+        self.assertEqual(len(table.attributes), 2)
+        first_col = table.attributes[0]
+        self.assertEqual(first_col.type, "CHAR")
+        self.assertEqual(first_col.length, 16)
+
+    def test_free_format_content(self):
+        """Test free-format content with no sequence areas to strip"""
+        dclgen = (
+            "EXEC SQL DECLARE TEST_TABLE TABLE\n"
+            "( FIRST_COL                     CHAR(16) NOT NULL,\n"
+            "  SECOND_COL                    INTEGER NOT NULL\n"
+            ") END-EXEC.\n"
+        )
+        table = self.parser.parse(dclgen)
+
+        self.assertEqual(table.table_name, "TEST_TABLE")
+        self.assertEqual(len(table.attributes), 2)
+
     def test_cobol_comments_in_declaration(self):
         """Test handling of COBOL comment lines (*) in attribute declarations"""
         dclgen_with_comments = """
@@ -1,7 +1,6 @@
 import unittest
 import csv
-import os
-from tempfile import NamedTemporaryFile
+import io
 
 from dclgen_parser.reporter import ReportGenerator
 from dclgen_parser.parser import Table, Attribute
@@ -27,76 +26,38 @@ class TestReportGenerator(unittest.TestCase):
             )
         }
 
-    def test_generate_report(self):
-        # Use a temporary file for testing
-        with NamedTemporaryFile(delete=False, suffix='.csv') as temp_file:
-            temp_filename = temp_file.name
-            
-        try:
-            # Generate report
-            self.report_generator.generate_report(self.sample_stats, temp_filename)
-            
-            # Verify file contents
-            with open(temp_filename, 'r', newline='') as csvfile:
-                reader = csv.reader(csvfile)
-                rows = list(reader)
-                
-                # Check header
-                self.assertEqual(rows[0], [ 'Table Name', 'Number of Attributes', 'File Path', 'Schema', 'Normalized File Name'])
-                
-                # Check data rows
-                self.assertEqual(len(rows), 3)  # Header + 2 data rows
-                
-                # Verify content is sorted by table name
-                self.assertEqual(rows[1][0], 'TABLE1')
-                self.assertEqual(rows[2][0], 'TABLE2')
-                
-                # Verify attribute counts
-                self.assertEqual(rows[1][1], '2')
-                self.assertEqual(rows[2][1], '1')
-                
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_filename)
+    def _generate_rows(self):
+        """Generate the report into an in-memory buffer and parse it back"""
+        buffer = io.StringIO()
+        self.report_generator.generate_report(self.sample_stats, buffer)
+        return list(csv.reader(io.StringIO(buffer.getvalue())))
 
-    def test_generate_report_includes_normalized_file_name(self):
-        with NamedTemporaryFile(delete=False, suffix='.csv') as temp_file:
-            temp_filename = temp_file.name
+    def test_generate_report(self):
+        rows = self._generate_rows()
 
-        try:
-            # Generate report
-            self.report_generator.generate_report(self.sample_stats, temp_filename)
+        # Check header
+        self.assertEqual(rows[0], [ 'Table Name', 'Number of Attributes', 'File Path', 'Schema', 'Normalized File Name'])
 
-            # Verify file contents
-            with open(temp_filename, 'r', newline='') as csvfile:
-                reader = csv.reader(csvfile)
-                header = next(reader)
+        # Check data rows
+        self.assertEqual(len(rows), 3)  # Header + 2 data rows
 
-                # Check for 'normalized file name' in header
-                self.assertIn('Normalized File Name', header)
+        # Verify content is sorted by table name
+        self.assertEqual(rows[1][0], 'TABLE1')
+        self.assertEqual(rows[2][0], 'TABLE2')
 
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_filename)
-    def test_generate_report_normalizes_file_name(self):
-        with NamedTemporaryFile(delete=False, suffix='.csv') as temp_file:
-            temp_filename = temp_file.name
+        # Verify attribute counts
+        self.assertEqual(rows[1][1], '2')
+        self.assertEqual(rows[2][1], '1')
 
-        try:
-            # Generate report
-            self.report_generator.generate_report(self.sample_stats, temp_filename)
-
-            # Verify file contents
-            with open(temp_filename, 'r', newline='') as csvfile:
-                reader = csv.reader(csvfile)
-                next(reader)  # Skip header
-                rows = list(reader)
+    def test_generate_report_includes_normalized_file_name(self):
+        header = self._generate_rows()[0]
 
-                # Check normalized file names
-                self.assertEqual(rows[0][4], 'TABLE1')
-                self.assertEqual(rows[1][4], 'TABLE2')
+        # Check for 'normalized file name' in header
+        self.assertIn('Normalized File Name', header)
 
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_filename)
+    def test_generate_report_normalizes_file_name(self):
+        rows = self._generate_rows()[1:]  # Skip header
 
+        # Check normalized file names
+        self.assertEqual(rows[0][4], 'TABLE1')
+        self.assertEqual(rows[1][4], 'TABLE2')
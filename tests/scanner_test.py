@@ -1,5 +1,6 @@
+import tempfile
 import unittest
-from unittest.mock import mock_open, patch, MagicMock
+from unittest.mock import patch
 from pathlib import Path
 
 from dclgen_parser.scanner import DCLGENScanner
@@ -7,6 +8,11 @@ from dclgen_parser.scanner import DCLGENScanner
 class TestDCLGENScanner(unittest.TestCase):
     def setUp(self):
         self.scanner = DCLGENScanner()
+        # Real files in a per-test directory instead of mocked opens: the
+        # mock machinery costs more than the handful of tiny files it avoids
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_path = Path(tmp_dir.name)
         self.sample_dclgen = """
       ******************************************************************
       * DCLGEN TABLE(EIP_ADT_TRAIL)                                    *
@@ -21,108 +27,122 @@ class TestDCLGENScanner(unittest.TestCase):
         
     def test_is_dclgen_file_valid_content(self):
         """Test that valid DCLGEN content is properly identified"""
-        with patch('builtins.open', mock_open(read_data=self.sample_dclgen)):
-            result = self.scanner.is_dclgen_file(Path('valid.dclgen'))
-            self.assertTrue(result)
-            
+        file_path = self.tmp_path / 'valid.dclgen'
+        file_path.write_text(self.sample_dclgen)
+        self.assertTrue(self.scanner.is_dclgen_file(file_path))
+
     def test_is_dclgen_file_invalid_content(self):
         """Test that non-DCLGEN content is properly rejected"""
-        non_dclgen_content = "This is not a DCLGEN file"
-        with patch('builtins.open', mock_open(read_data=non_dclgen_content)):
-            result = self.scanner.is_dclgen_file(Path('invalid.txt'))
-            self.assertFalse(result)
-            
-    def test_is_dclgen_file_unicode_error(self):
-        """Test handling of Unicode decode errors"""
-        with patch('builtins.open', side_effect=UnicodeDecodeError('utf-8', b'', 0, 1, 'invalid')):
-            result = self.scanner.is_dclgen_file(Path('binary.file'))
-            self.assertFalse(result)
-            
+        file_path = self.tmp_path / 'invalid.txt'
+        file_path.write_text("This is not a DCLGEN file")
+        self.assertFalse(self.scanner.is_dclgen_file(file_path))
+
+    def test_is_dclgen_file_binary_content(self):
+        """Test handling of binary files with invalid UTF-8 content"""
+        file_path = self.tmp_path / 'binary.file'
+        file_path.write_bytes(b'\xff\xfe\x00\x01 not a dclgen \x80\x81')
+        self.assertFalse(self.scanner.is_dclgen_file(file_path))
+
     def test_is_dclgen_file_io_error(self):
         """Test handling of IO errors"""
-        with patch('builtins.open', side_effect=IOError('Test IO Error')):
-            result = self.scanner.is_dclgen_file(Path('nonexistent.file'))
-            self.assertFalse(result)
+        result = self.scanner.is_dclgen_file(self.tmp_path / 'nonexistent.file')
+        self.assertFalse(result)
 
     def test_scan_directory_single_file(self):
         """Test scanning a directory with a single DCLGEN file"""
-        mock_path = MagicMock(spec=Path)
-        mock_path.is_file.return_value = True
-        mock_path.relative_to.return_value = Path('test.dclgen')
-
-        with patch('pathlib.Path.rglob') as mock_rglob:
-            mock_rglob.return_value = [mock_path]
-            
-            # Mock the file reading operations
-            with patch.object(self.scanner, 'is_dclgen_file', return_value=True):
-                with patch('builtins.open', mock_open(read_data=self.sample_dclgen)):
-                    result = self.scanner.scan_directory('/dummy/path')
-                    
-                    # Verify results
-                    self.assertIn('EIP_ADT_TRAIL', result)
-                    table = result['EIP_ADT_TRAIL']
-                    self.assertEqual(len(table.attributes), 4)
+        (self.tmp_path / 'test.dclgen').write_text(self.sample_dclgen)
+        result = self.scanner.scan_directory(str(self.tmp_path))
+
+        # Verify results
+        self.assertIn('EIP_ADT_TRAIL', result)
+        table = result['EIP_ADT_TRAIL']
+        self.assertEqual(len(table.attributes), 4)
 
     def test_scan_directory_multiple_files(self):
         """Test scanning a directory with multiple DCLGEN files raises an error"""
-        mock_path1 = MagicMock(spec=Path)
-        mock_path1.is_file.return_value = True
-        mock_path1.relative_to.return_value = Path('test1.dclgen')
-
-        mock_path2 = MagicMock(spec=Path)
-        mock_path2.is_file.return_value = True
-        mock_path2.relative_to.return_value = Path('test2.dclgen')
-
-        with patch('pathlib.Path.rglob') as mock_rglob:
-            mock_rglob.return_value = [mock_path1, mock_path2]
-            
-            with patch.object(self.scanner, 'is_dclgen_file', return_value=True):
-                with patch('builtins.open', mock_open(read_data=self.sample_dclgen)):
-                    with self.assertRaises(ValueError) as context:
-                        self.scanner.scan_directory('/dummy/path')
-                    
-                    self.assertIn("Table 'EIP_ADT_TRAIL' is defined more than once", str(context.exception))
+        (self.tmp_path / 'test1.dclgen').write_text(self.sample_dclgen)
+        (self.tmp_path / 'test2.dclgen').write_text(self.sample_dclgen)
+
+        with self.assertRaises(ValueError) as context:
+            self.scanner.scan_directory(str(self.tmp_path))
+
+        self.assertIn("Table 'EIP_ADT_TRAIL' is defined more than once", str(context.exception))
 
     def test_scan_directory_with_errors(self):
         """Test scanning a directory with a file that raises an error"""
-        mock_path = MagicMock(spec=Path)
-        mock_path.is_file.return_value = True
-        mock_path.relative_to.return_value = Path('error.dclgen')
-        mock_path.__str__.return_value = 'error.dclgen'
-
-        with patch('pathlib.Path.rglob') as mock_rglob:
-            mock_rglob.return_value = [mock_path]
-            
-            with patch.object(self.scanner, 'is_dclgen_file', return_value=True):
-                with patch('builtins.open', side_effect=Exception('Test error')):
-                    with self.assertRaises(Exception) as context:
-                        self.scanner.scan_directory('/dummy/path')
-                    
-                    self.assertIn("Test error", str(context.exception))
+        (self.tmp_path / 'error.dclgen').write_text(self.sample_dclgen)
+
+        # Fault injection still needs a patch; everything else is real I/O
+        with patch('builtins.open', side_effect=Exception('Test error')):
+            with self.assertRaises(Exception) as context:
+                self.scanner.scan_directory(str(self.tmp_path))
+
+            self.assertIn("Test error", str(context.exception))
 
     def test_scan_directory_empty(self):
         """Test scanning an empty directory"""
-        with patch('pathlib.Path.rglob') as mock_rglob:
-            mock_rglob.return_value = []
-            result = self.scanner.scan_directory('/dummy/path')
-            self.assertEqual(len(result), 0)
+        result = self.scanner.scan_directory(str(self.tmp_path))
+        self.assertEqual(len(result), 0)
 
     def test_scan_directory_no_dclgen_files(self):
         """Test scanning a directory with no DCLGEN files"""
-        mock_path = MagicMock(spec=Path)
-        mock_path.is_file.return_value = True
-        
-        with patch('pathlib.Path.rglob') as mock_rglob:
-            mock_rglob.return_value = [mock_path]
-            
-            with patch.object(self.scanner, 'is_dclgen_file', return_value=False):
-                result = self.scanner.scan_directory('/dummy/path')
-                self.assertEqual(len(result), 0)
+        (self.tmp_path / 'notes.txt').write_text("This is not a DCLGEN file")
+        result = self.scanner.scan_directory(str(self.tmp_path))
+        self.assertEqual(len(result), 0)
+
+    def test_scan_directory_parallel(self):
+        """Test that the parallel scan finds the same tables as the serial one"""
+        (self.tmp_path / 'test.dclgen').write_text(self.sample_dclgen)
+        result = self.scanner.scan_directory_parallel(str(self.tmp_path))
+
+        self.assertIn('EIP_ADT_TRAIL', result)
+        self.assertEqual(len(result['EIP_ADT_TRAIL'].attributes), 4)
+
+    def test_scan_directory_with_cache(self):
+        """Test that a cached scan reuses results for unchanged files"""
+        from dclgen_parser.scanner import ScanCache
+        (self.tmp_path / 'test.dclgen').write_text(self.sample_dclgen)
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        cache_file = str(Path(cache_dir.name) / 'scan.pkl')
+
+        scanner = DCLGENScanner(cache=ScanCache(cache_file))
+        result = scanner.scan_directory(str(self.tmp_path))
+        self.assertIn('EIP_ADT_TRAIL', result)
+        self.assertTrue(Path(cache_file).exists())
+
+        # A second scan must not re-read the unchanged file
+        cached_scanner = DCLGENScanner(cache=ScanCache(cache_file))
+        with patch.object(cached_scanner, '_read_dclgen') as mock_read:
+            result = cached_scanner.scan_directory(str(self.tmp_path))
+            mock_read.assert_not_called()
+        self.assertIn('EIP_ADT_TRAIL', result)
+
+    def test_scan_directory_parallel_with_cache(self):
+        """Test that the parallel scan populates and reuses the scan cache"""
+        from dclgen_parser.scanner import ScanCache
+        (self.tmp_path / 'test.dclgen').write_text(self.sample_dclgen)
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        cache_file = str(Path(cache_dir.name) / 'scan.pkl')
+
+        scanner = DCLGENScanner(cache=ScanCache(cache_file))
+        result = scanner.scan_directory_parallel(str(self.tmp_path))
+        self.assertIn('EIP_ADT_TRAIL', result)
+        self.assertTrue(Path(cache_file).exists())
+
+        # A serial scan over the same cache must not re-read the file,
+        # proving the parallel scan populated it
+        cached_scanner = DCLGENScanner(cache=ScanCache(cache_file))
+        with patch.object(cached_scanner, '_read_dclgen') as mock_read:
+            result = cached_scanner.scan_directory(str(self.tmp_path))
+            mock_read.assert_not_called()
+        self.assertIn('EIP_ADT_TRAIL', result)
 
     def test_duplicate_table_error(self):
         # Simulate duplicate table scenario
-        directory_path = "test_resources/duplicate_tables"
-        Path(directory_path).mkdir(parents=True, exist_ok=True)
+        directory_path = self.tmp_path / "duplicate_tables"
+        directory_path.mkdir()
 
         # Create two files with the same table name
         file_content = """
@@ -132,11 +152,11 @@ class TestDCLGENScanner(unittest.TestCase):
             NAME VARCHAR(255)
         ) END-EXEC.
         """
-        (Path(directory_path) / "file1.dclgen").write_text(file_content)
-        (Path(directory_path) / "file2.dclgen").write_text(file_content)
+        (directory_path / "file1.dclgen").write_text(file_content)
+        (directory_path / "file2.dclgen").write_text(file_content)
 
         with self.assertRaises(ValueError) as context:
-            self.scanner.scan_directory(directory_path)
+            self.scanner.scan_directory(str(directory_path))
 
         self.assertIn("Table 'TABLE1' is defined more than once", str(context.exception))
 
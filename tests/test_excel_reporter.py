@@ -1,7 +1,7 @@
 import unittest
 from dclgen_parser.parser import Attribute, Table
 from dclgen_parser.excel_reporter import ExcelReporter
-import os
+import io
 from openpyxl import load_workbook
 
 class TestExcelReporter(unittest.TestCase):
@@ -24,18 +24,16 @@ class TestExcelReporter(unittest.TestCase):
                 ]
             )
         ]
-        self.output_file = "test_report.xlsx"
-
-    def tearDown(self):
-        if os.path.exists(self.output_file):
-            os.remove(self.output_file)
 
     def test_generate_excel_report(self):
-        self.reporter.generate_excel_report(self.test_tables, self.output_file)
-        self.assertTrue(os.path.exists(self.output_file))
+        # Keep the workbook entirely in memory: no disk I/O per test run
+        buffer = io.BytesIO()
+        self.reporter.generate_excel_report(self.test_tables, buffer)
+        self.assertGreater(len(buffer.getvalue()), 0)
 
         # Load the workbook and verify its contents
-        workbook = load_workbook(self.output_file)
+        buffer.seek(0)
+        workbook = load_workbook(buffer)
         sheet = workbook.active
 
         # Check headers